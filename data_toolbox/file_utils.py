@@ -1,9 +1,156 @@
+import mmap
 import os
-import pptx
+import posixpath
+import zipfile
 from docx import Document
-import PyPDF2
+import fitz
+from lxml import etree
 import shutil
-import os
+import threading
+from collections import OrderedDict
+from concurrent.futures import ProcessPoolExecutor, ThreadPoolExecutor
+from functools import partial, wraps
+from itertools import repeat
+
+try:
+    from fast_reading import FlattenFilesBatchIterator
+except ImportError:
+    FlattenFilesBatchIterator = None
+
+
+# Minimum page count for read_pdf_document to amortize the cost of starting worker processes
+PARALLEL_PDF_MIN_PAGES = 20
+# Number of pages each worker extracts per task, bounding the memory held by a single result
+PDF_PAGE_BATCH_SIZE = 10
+# PDFs at least this large are read through a memory map in a single pass instead of many small reads
+PDF_MMAP_MIN_SIZE = 64 * 1024
+# XML namespaces used inside PowerPoint packages
+PPTX_NAMESPACES = {
+    'a': 'http://schemas.openxmlformats.org/drawingml/2006/main',
+    'p': 'http://schemas.openxmlformats.org/presentationml/2006/main',
+    'r': 'http://schemas.openxmlformats.org/officeDocument/2006/relationships',
+    'rels': 'http://schemas.openxmlformats.org/package/2006/relationships',
+}
+PPTX_RUN_TAGS = {f"{{{PPTX_NAMESPACES['a']}}}r", f"{{{PPTX_NAMESPACES['a']}}}fld"}
+PPTX_LINE_BREAK_TAG = f"{{{PPTX_NAMESPACES['a']}}}br"
+# XML namespaces and tags used inside Word packages
+DOCX_NAMESPACES = {'w': 'http://schemas.openxmlformats.org/wordprocessingml/2006/main'}
+DOCX_BODY_TAG = f"{{{DOCX_NAMESPACES['w']}}}body"
+DOCX_PARAGRAPH_TAG = f"{{{DOCX_NAMESPACES['w']}}}p"
+DOCX_TABLE_TAG = f"{{{DOCX_NAMESPACES['w']}}}tbl"
+DOCX_TEXT_TAG = f"{{{DOCX_NAMESPACES['w']}}}t"
+DOCX_TAB_TAGS = {f"{{{DOCX_NAMESPACES['w']}}}tab", f"{{{DOCX_NAMESPACES['w']}}}ptab"}
+DOCX_NO_BREAK_HYPHEN_TAG = f"{{{DOCX_NAMESPACES['w']}}}noBreakHyphen"
+DOCX_BREAK_TAGS = {f"{{{DOCX_NAMESPACES['w']}}}br", f"{{{DOCX_NAMESPACES['w']}}}cr"}
+DOCX_BREAK_TYPE_ATTR = f"{{{DOCX_NAMESPACES['w']}}}type"
+# Maximum number of parsed documents kept in memory by cached_file_reader
+FILE_READER_CACHE_SIZE = 512
+
+
+def cached_file_reader(func):
+    """
+    Memoizes a document reader on the file's absolute path, modification time and size.
+
+    A cached result is reused only while the file's `st_mtime_ns` and `st_size` are unchanged, so edited
+    files are re-parsed automatically. Failed reads (None) are not cached, and at most
+    FILE_READER_CACHE_SIZE results are kept, evicting the least recently used first.
+
+    Args:
+        func (Callable): A reader taking the file path as its first argument and returning a list of strings.
+
+    Returns:
+        Callable: The wrapped reader, with a `cache_clear()` method to drop all cached results.
+    """
+    cache = OrderedDict()
+    lock = threading.Lock()
+
+    @wraps(func)
+    def wrapper(file_path, *args, **kwargs):
+        try:
+            stat = os.stat(file_path)
+        except OSError:
+            # Let the reader report the error in its usual way
+            return func(file_path, *args, **kwargs)
+
+        key = (os.path.abspath(file_path), stat.st_mtime_ns, stat.st_size, args, tuple(sorted(kwargs.items())))
+        with lock:
+            if key in cache:
+                cache.move_to_end(key)
+                return list(cache[key])
+
+        result = func(file_path, *args, **kwargs)
+        if result is None:
+            return None
+
+        with lock:
+            cache[key] = list(result)
+            cache.move_to_end(key)
+            if len(cache) > FILE_READER_CACHE_SIZE:
+                cache.popitem(last=False)
+
+        return result
+
+    wrapper.cache_clear = cache.clear
+    return wrapper
+
+
+def _scan_directory(directory, suffix):
+    """
+    Scans a single directory level and splits its entries into matching files and subdirectories.
+
+    Args:
+        directory (str): The path of the directory to scan.
+        suffix (Tuple[str, ...]): The suffixes of the files to search for.
+
+    Returns:
+        Tuple[List[str], List[str]]: The matching file paths and the subdirectory paths.
+    """
+    files = []
+    subdirs = []
+
+    try:
+        with os.scandir(directory) as entries:
+            for entry in entries:
+                if entry.is_dir():
+                    # Like os.walk, symlinks to directories are not files but are not descended into
+                    if not entry.is_symlink():
+                        subdirs.append(entry.path)
+                elif entry.name.endswith(suffix):
+                    files.append(entry.path)
+    except OSError as e:
+        print(f"Error scanning directory: {e}")
+
+    return files, subdirs
+
+
+def iter_suffix_files(directory, suffix='.csv'):
+    """
+    Recursively traverse a specified directory and lazily yield paths of all files with a given suffix.
+
+    Directories are scanned with `os.scandir` and each level of the tree is dispatched to a thread pool,
+    since the traversal is I/O-bound and the underlying system calls release the GIL. Paths are yielded
+    as soon as their directory has been scanned, so callers can start processing before the walk ends.
+
+    Args:
+        directory (str): The path of the directory to traverse.
+        suffix (str or Tuple[str, ...]): The suffix (or suffixes) of the files to search for. Default is '.csv'.
+
+    Yields:
+        str: The path of each file with the specified suffix.
+    """
+    # Normalize once so every check is a single str.endswith call
+    suffix = (suffix,) if isinstance(suffix, str) else tuple(suffix)
+
+    pending = [directory]
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        while pending:
+            next_pending = []
+            for files, subdirs in executor.map(_scan_directory, pending, repeat(suffix)):
+                yield from files
+                next_pending.extend(subdirs)
+            pending = next_pending
 
 
 def get_all_suffix_files(directory, suffix='.csv'):
@@ -12,25 +159,78 @@ def get_all_suffix_files(directory, suffix='.csv'):
 
     Args:
         directory (str): The path of the directory to traverse.
-        suffix (str): The suffix of the files to search for. Default is '.csv'.
+        suffix (str or Tuple[str, ...]): The suffix (or suffixes) of the files to search for. Default is '.csv'.
 
     Returns:
         List[str]: A list of paths of all files with the specified suffix.
     """
-    target_files = []
+    return list(iter_suffix_files(directory, suffix))
 
-    for root, _, files in os.walk(directory):
-        for file in files:
-            if file.endswith(suffix):
-                target_files.append(os.path.join(root, file))
 
-    return target_files
+def _read_pptx_slide_parts(pptx_zip):
+    """
+    Reads the XML of every slide in a PowerPoint package, in presentation order.
 
+    Args:
+        pptx_zip (zipfile.ZipFile): The opened PowerPoint package.
+
+    Returns:
+        List[bytes]: The raw XML of each slide part.
+    """
+    presentation = etree.fromstring(pptx_zip.read('ppt/presentation.xml'))
+    rels = etree.fromstring(pptx_zip.read('ppt/_rels/presentation.xml.rels'))
+    targets = {rel.get('Id'): rel.get('Target') for rel in rels.iterfind('rels:Relationship', PPTX_NAMESPACES)}
+
+    slide_parts = []
+    for rel_id in presentation.xpath('./p:sldIdLst/p:sldId/@r:id', namespaces=PPTX_NAMESPACES):
+        target = targets[rel_id]
+        if target.startswith('/'):
+            part_name = target.lstrip('/')
+        else:
+            part_name = posixpath.normpath(posixpath.join('ppt', target))
+        slide_parts.append(pptx_zip.read(part_name))
+
+    return slide_parts
+
+
+def _extract_slide_texts(slide_xml):
+    """
+    Extracts the text of each top-level shape on a slide.
+
+    Paragraphs are joined with newlines and line breaks become vertical tabs, matching python-pptx's `shape.text`.
 
+    Args:
+        slide_xml (bytes): The raw XML of the slide part.
+
+    Returns:
+        List[str]: The text of each shape that has a text frame.
+    """
+    slide = etree.fromstring(slide_xml)
+    shape_texts = []
+
+    for text_body in slide.xpath('./p:cSld/p:spTree/p:sp/p:txBody', namespaces=PPTX_NAMESPACES):
+        paragraphs = []
+        for paragraph in text_body.iterfind('a:p', PPTX_NAMESPACES):
+            pieces = []
+            for child in paragraph:
+                if child.tag == PPTX_LINE_BREAK_TAG:
+                    pieces.append('\v')
+                elif child.tag in PPTX_RUN_TAGS:
+                    pieces.append(child.findtext('a:t', default='', namespaces=PPTX_NAMESPACES))
+            paragraphs.append(''.join(pieces))
+        shape_texts.append('\n'.join(paragraphs))
+
+    return shape_texts
+
+
+@cached_file_reader
 def extract_text_from_pptx_as_list(file_path):
     """
     Extracts all text from a PowerPoint (.pptx) file and returns it as a list of strings.
 
+    The slide XML is parsed directly with lxml instead of building python-pptx's object model,
+    and slides are parsed concurrently on a thread pool.
+
     Args:
         file_path (str): The path to the PowerPoint file.
 
@@ -39,7 +239,8 @@ def extract_text_from_pptx_as_list(file_path):
     """
     try:
         # Open the PowerPoint file
-        presentation = pptx.Presentation(file_path)
+        with zipfile.ZipFile(file_path) as pptx_zip:
+            slide_parts = _read_pptx_slide_parts(pptx_zip)
     except Exception as e:
         print(f"Error opening PowerPoint file: {e}")
         return None
@@ -47,10 +248,10 @@ def extract_text_from_pptx_as_list(file_path):
     ppt_texts = []
 
     try:
-        for slide in presentation.slides:
-            for shape in slide.shapes:
-                if hasattr(shape, "text"):
-                    ppt_texts.append(shape.text)
+        max_workers = min(32, os.cpu_count() or 1)
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            for shape_texts in executor.map(_extract_slide_texts, slide_parts):
+                ppt_texts.extend(shape_texts)
     except Exception as e:
         print(f"Error extracting text: {e}")
         return None
@@ -58,16 +259,65 @@ def extract_text_from_pptx_as_list(file_path):
     return ppt_texts
 
 
-def read_word_document(file_path):
+def _iter_docx_paragraph_texts(file_path):
+    """
+    Streams the text of each body-level paragraph of a Word (.docx) document.
+
+    `word/document.xml` is parsed incrementally and every processed element is cleared, so memory use
+    stays flat regardless of document length. Paragraphs nested in tables are skipped, matching
+    python-docx's `Document.paragraphs`.
+
+    Args:
+        file_path (str): The path to the Word document.
+
+    Yields:
+        str: The text of each paragraph, with tabs as '\t', line breaks as '\n' and non-breaking hyphens as '-'.
+    """
+    with zipfile.ZipFile(file_path) as docx_zip, docx_zip.open('word/document.xml') as document_xml:
+        for _, elem in etree.iterparse(document_xml, events=('end',), tag=(DOCX_PARAGRAPH_TAG, DOCX_TABLE_TAG)):
+            parent = elem.getparent()
+            if parent is None or parent.tag != DOCX_BODY_TAG:
+                continue
+
+            if elem.tag == DOCX_PARAGRAPH_TAG:
+                pieces = []
+                for child in elem.xpath('./w:r/* | ./w:hyperlink/w:r/*', namespaces=DOCX_NAMESPACES):
+                    if child.tag == DOCX_TEXT_TAG:
+                        pieces.append(child.text or '')
+                    elif child.tag in DOCX_TAB_TAGS:
+                        pieces.append('\t')
+                    elif child.tag == DOCX_NO_BREAK_HYPHEN_TAG:
+                        pieces.append('-')
+                    elif child.tag in DOCX_BREAK_TAGS and child.get(DOCX_BREAK_TYPE_ATTR) in (None, 'textWrapping'):
+                        pieces.append('\n')
+                yield ''.join(pieces)
+
+            # Drop the processed element and everything parsed before it
+            elem.clear()
+            while elem.getprevious() is not None:
+                del parent[0]
+
+
+@cached_file_reader
+def read_word_document(file_path, fast=True):
     """
     Reads the text content from a Word (.docx) document and returns it as a list of strings.
 
     Args:
         file_path (str): The path to the Word document.
+        fast (bool): Whether to stream `word/document.xml` with lxml instead of building python-docx's
+            object model. Set to False to read through python-docx. Default is True.
 
     Returns:
         Optional[List[str]]: A list of strings, each containing text from a paragraph, or None if an error occurs.
     """
+    if fast:
+        try:
+            return list(_iter_docx_paragraph_texts(file_path))
+        except Exception as e:
+            print(f"Error reading Word document: {e}")
+            return None
+
     try:
         # Open the Word document
         doc = Document(file_path)
@@ -88,26 +338,256 @@ def read_word_document(file_path):
     return text_content
 
 
-def read_pdf_document(file_path):
+def _open_pdf(file_path):
+    """
+    Opens a PDF document with PyMuPDF.
+
+    Files of at least PDF_MMAP_MIN_SIZE bytes are memory-mapped and copied to PyMuPDF as one in-memory buffer,
+    which replaces the many small seeks and reads of parsing from a file handle. This holds a full copy of
+    the file for as long as the document is open, so it is only used by `_read_all_pdf_pages`, where every
+    page is read anyway. Smaller files are opened by path, where the mapping overhead would dominate.
+
+    Args:
+        file_path (str): The path to the PDF document.
+
+    Returns:
+        fitz.Document: The opened document. The caller is responsible for closing it.
+    """
+    if os.path.getsize(file_path) < PDF_MMAP_MIN_SIZE:
+        return fitz.open(file_path)
+
+    with open(file_path, 'rb') as pdf_file, mmap.mmap(pdf_file.fileno(), 0, access=mmap.ACCESS_READ) as mm:
+        # PyMuPDF only accepts bytes-like streams it can own, so the mapping is copied out in one go
+        data = bytes(mm)
+
+    return fitz.open(stream=data, filetype='pdf')
+
+
+def _read_all_pdf_pages(file_path):
+    """
+    Extracts the text of every page of a PDF document in a single pass.
+
+    Args:
+        file_path (str): The path to the PDF document.
+
+    Returns:
+        List[str]: The text content of each page.
+    """
+    with _open_pdf(file_path) as doc:
+        return [page.get_text("text") for page in doc]
+
+
+def _extract_pdf_pages(file_path, page_nums):
+    """
+    Extracts the text of a batch of pages from a PDF document.
+
+    Each call opens the document on its own, so batches can run in separate processes. The document is
+    opened by path, so PyMuPDF only reads the objects these pages need instead of a full copy of the file.
+
+    Args:
+        file_path (str): The path to the PDF document.
+        page_nums (range): The zero-based indices of the pages.
+
+    Returns:
+        List[str]: The text content of each page.
+    """
+    with fitz.open(file_path) as doc:
+        return [doc.load_page(page_num).get_text("text") for page_num in page_nums]
+
+
+def iter_pdf_pages(file_path):
+    """
+    Lazily yields the text content of a PDF document one page at a time.
+
+    The document is opened by path, so PyMuPDF reads objects on demand and only the current page's text
+    is held in memory, which lets callers stream large documents.
+
+    Args:
+        file_path (str): The path to the PDF document.
+
+    Yields:
+        str: The text content of each page, in order.
+
+    Raises:
+        RuntimeError: If the document cannot be opened or parsed (e.g. fitz.FileDataError).
+    """
+    doc = fitz.open(file_path)
+    try:
+        for page_num in range(doc.page_count):
+            yield doc.load_page(page_num).get_text("text")
+    finally:
+        doc.close()
+
+
+@cached_file_reader
+def read_pdf_document(file_path, parallel=False):
     """
     Reads the text content from a PDF document and returns it as a list of strings.
 
+    Text is extracted with PyMuPDF in "text" mode, which keeps the natural reading order of each page
+    through MuPDF's own layout heuristics, so no separate layout pass is required.
+
     Args:
         file_path (str): The path to the PDF document.
+        parallel (bool): Whether to extract pages in worker processes for documents with at least
+            PARALLEL_PDF_MIN_PAGES pages. The caller must be able to start child processes (e.g. not a
+            daemonic worker, and with a `__main__` guard under the spawn start method); if the pool cannot
+            run, pages are extracted serially instead. Default is False.
 
     Returns:
         Optional[List[str]]: A list of strings, each containing text from a page, or None if an error occurs.
     """
     try:
-        with open(file_path, 'rb') as pdf_file:
-            pdf_reader = PyPDF2.PdfReader(pdf_file)
-            num_pages = len(pdf_reader.pages)
-            text_list = [pdf_reader.pages[page_num].extract_text() for page_num in range(num_pages)]  
-    except Exception as e:
+        if not parallel:
+            return _read_all_pdf_pages(file_path)
+
+        with fitz.open(file_path) as doc:
+            num_pages = doc.page_count
+        if num_pages < PARALLEL_PDF_MIN_PAGES:
+            return _read_all_pdf_pages(file_path)
+
+        workers = min(os.cpu_count() or 1, 6)
+        batches = [range(start, min(start + PDF_PAGE_BATCH_SIZE, num_pages))
+                   for start in range(0, num_pages, PDF_PAGE_BATCH_SIZE)]
+        try:
+            with ProcessPoolExecutor(max_workers=workers) as executor:
+                return [text for batch in executor.map(partial(_extract_pdf_pages, file_path), batches)
+                        for text in batch]
+        except Exception as e:
+            # e.g. a killed worker, a daemonic caller that may not have children, or a caller without
+            # a __main__ guard under the spawn start method
+            print(f"Parallel PDF extraction failed, reading serially: {e!r}")
+            return _read_all_pdf_pages(file_path)
+    except (fitz.FileDataError, RuntimeError, OSError) as e:
+        # PyMuPDF reports missing and unreadable files as RuntimeError subclasses
         print(f"Error reading PDF document: {e}")
         return None
 
-    return text_list
+
+def read_pdfs_batch(paths, workers=None):
+    """
+    Reads the text content from many PDF documents in parallel, one process per document.
+
+    Only the file paths cross the process boundary, so no parser objects need to be pickled.
+
+    Args:
+        paths (List[str]): The paths to the PDF documents.
+        workers (int, optional): The number of worker processes. Default is min(cpu_count, 6).
+
+    Returns:
+        Dict[str, Optional[List[str]]]: A mapping from each path to its list of page texts,
+            or to None if that document could not be read.
+    """
+    paths = list(paths)
+    if workers is None:
+        workers = min(os.cpu_count() or 1, 6)
+
+    results = {}
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # Documents are already spread over processes, so pages are extracted serially within each one
+        futures = [executor.submit(read_pdf_document, path) for path in paths]
+        for path, future in zip(paths, futures):
+            try:
+                results[path] = future.result()
+            except Exception as e:
+                # A crashed worker only loses its own document, not the whole batch
+                print(f"Error reading PDF document {path}: {e}")
+                results[path] = None
+
+    return results
+
+
+def _read_file_bytes(file_path):
+    """
+    Reads the raw content of a file.
+
+    Args:
+        file_path (str): The path to the file.
+
+    Returns:
+        Optional[bytes]: The content of the file, or None if an error occurs.
+    """
+    try:
+        with open(file_path, 'rb') as f:
+            return f.read()
+    except OSError as e:
+        print(f"Error reading file: {e}")
+        return None
+
+
+def iter_file_bytes(paths, batch_size=64):
+    """
+    Lazily yields the raw content of many files, reading them in batches.
+
+    If the optional `fast_reading` package is installed, each batch is first read in Rust by its
+    `FlattenFilesBatchIterator`. Otherwise, or if that fails for a batch (e.g. because a file is missing),
+    the batch is read concurrently on a thread pool, so both backends behave the same on errors.
+
+    Args:
+        paths (List[str]): The paths to the files.
+        batch_size (int): The number of files read per batch. Default is 64.
+
+    Yields:
+        Optional[bytes]: The content of each file, in the order of `paths`, or None for files that cannot be read.
+    """
+    paths = list(paths)
+
+    max_workers = min(32, (os.cpu_count() or 1) * 4)
+    with ThreadPoolExecutor(max_workers=max_workers) as executor:
+        for start in range(0, len(paths), batch_size):
+            batch = paths[start:start + batch_size]
+
+            if FlattenFilesBatchIterator is not None:
+                try:
+                    contents = [bytes(data) for data in FlattenFilesBatchIterator(batch, batch_size=len(batch))]
+                except Exception as e:
+                    print(f"Error reading files with fast_reading, reading batch on threads: {e}")
+                else:
+                    if len(contents) == len(batch):
+                        yield from contents
+                        continue
+
+            yield from executor.map(_read_file_bytes, batch)
+
+
+def read_many(paths, encoding='utf-8', batch_size=64):
+    """
+    Reads the content of many files, choosing a reader by file suffix.
+
+    PDF, Word and PowerPoint files go through their document readers. All other files are read in bulk
+    with `iter_file_bytes` and decoded as text.
+
+    Args:
+        paths (List[str]): The paths to the files.
+        encoding (str): The encoding used to decode plain files. Default is 'utf-8'.
+        batch_size (int): The number of plain files read per batch. Default is 64.
+
+    Returns:
+        Dict[str, Optional[Union[List[str], str]]]: A mapping from each path to its content: a list of strings
+            for documents, a string for plain files, or None if the file could not be read.
+    """
+    document_readers = {
+        '.pdf': read_pdf_document,
+        '.docx': read_word_document,
+        '.pptx': extract_text_from_pptx_as_list,
+    }
+
+    paths = list(paths)
+    results = dict.fromkeys(paths)
+    plain_paths = []
+
+    for path in paths:
+        reader = document_readers.get(os.path.splitext(path)[1].lower())
+        if reader is None:
+            plain_paths.append(path)
+        else:
+            results[path] = reader(path)
+
+    for path, data in zip(plain_paths, iter_file_bytes(plain_paths, batch_size=batch_size)):
+        results[path] = None if data is None else data.decode(encoding, errors='replace')
+
+    return results
 
 
 def copy_files(file_list, destination_path) -> None:
@@ -0,0 +1,207 @@
+import numpy as np
+
+try:
+    from numba import njit, prange
+except ImportError:
+    njit = prange = None
+
+
+def _rolling_mean_numpy(a, window):
+    n = a.shape[0]
+    out = np.full(n, np.nan)
+    if n < window:
+        return out
+
+    # Split the data into blocks of `window` values. Every window spans at most two adjacent blocks, so its
+    # sum is a suffix sum of one block plus a prefix sum of the next. Unlike a global cumsum difference,
+    # this never subtracts large running totals, so no precision is lost to cancellation.
+    finite = np.isfinite(a)
+    n_blocks = -(-n // window)
+    blocks = np.zeros(n_blocks * window)
+    blocks[:n] = np.where(finite, a, 0.0)
+    blocks = blocks.reshape(n_blocks, window)
+    prefix = np.cumsum(blocks, axis=1).ravel()
+    suffix = np.cumsum(blocks[:, ::-1], axis=1)[:, ::-1].ravel()
+
+    ends = np.arange(window - 1, n)
+    starts = ends - window + 1
+    window_sums = suffix[starts] + np.where(starts % window == 0, 0.0, prefix[ends])
+
+    # Windows with a NaN or an infinite value are NaN, as in pandas
+    non_finite = np.concatenate(([0], np.cumsum(~finite)))
+    window_non_finite = non_finite[ends + 1] - non_finite[starts]
+    out[window - 1:] = np.where(window_non_finite == 0, window_sums / window, np.nan)
+    return out
+
+
+def _zscore_numpy(a):
+    return (a - np.nanmean(a)) / np.nanstd(a)
+
+
+def _group_reduce_numpy(codes, values, n_groups, use_max):
+    out = np.full(n_groups, np.nan)
+    mask = (codes >= 0) & ~np.isnan(values)
+    # fmin/fmax ignore the NaN placeholders of groups that have no value yet
+    (np.fmax if use_max else np.fmin).at(out, codes[mask], values[mask])
+    return out
+
+
+if njit is not None:
+    @njit(cache=True, parallel=True)
+    def _rolling_mean(a, window):
+        # Same block decomposition as _rolling_mean_numpy, with the blocks summed in parallel
+        n = a.shape[0]
+        out = np.full(n, np.nan)
+        if n < window:
+            return out
+
+        non_finite = np.zeros(n + 1, dtype=np.int64)
+        for i in range(n):
+            non_finite[i + 1] = non_finite[i] + (0 if np.isfinite(a[i]) else 1)
+
+        prefix = np.empty(n, dtype=np.float64)
+        suffix = np.empty(n, dtype=np.float64)
+        for k in prange((n + window - 1) // window):
+            start = k * window
+            end = min(start + window, n)
+            total = 0.0
+            for i in range(start, end):
+                if np.isfinite(a[i]):
+                    total += a[i]
+                prefix[i] = total
+            total = 0.0
+            for i in range(end - 1, start - 1, -1):
+                if np.isfinite(a[i]):
+                    total += a[i]
+                suffix[i] = total
+
+        for j in prange(window - 1, n):
+            start = j - window + 1
+            if non_finite[j + 1] - non_finite[start] == 0:
+                total = suffix[start] if start % window == 0 else suffix[start] + prefix[j]
+                out[j] = total / window
+        return out
+
+    @njit(cache=True, parallel=True)
+    def _zscore(a):
+        n = a.shape[0]
+        total = 0.0
+        count = 0
+        for i in prange(n):
+            if not np.isnan(a[i]):
+                total += a[i]
+                count += 1
+        mean = total / count if count > 0 else np.nan
+
+        squares = 0.0
+        for i in prange(n):
+            if not np.isnan(a[i]):
+                squares += (a[i] - mean) ** 2
+        std = np.sqrt(squares / count) if count > 0 else np.nan
+
+        out = np.empty(n, dtype=np.float64)
+        for i in prange(n):
+            out[i] = (a[i] - mean) / std
+        return out
+
+    @njit(cache=True)
+    def _group_reduce(codes, values, n_groups, use_max):
+        out = np.full(n_groups, np.nan)
+        for i in range(values.shape[0]):
+            code = codes[i]
+            value = values[i]
+            if code < 0 or np.isnan(value):
+                continue
+            if np.isnan(out[code]) or (value > out[code] if use_max else value < out[code]):
+                out[code] = value
+        return out
+else:
+    # Without Numba the vectorized NumPy implementations are used instead
+    _rolling_mean = _rolling_mean_numpy
+    _zscore = _zscore_numpy
+    _group_reduce = _group_reduce_numpy
+
+
+def rolling_mean(a, window):
+    """
+    Computes the trailing rolling mean of a 1-D array.
+
+    Args:
+        a (array-like): The input data.
+        window (int): The number of observations in each window.
+
+    Returns:
+        np.ndarray: The rolling mean as float64. The first `window - 1` entries, and every window containing
+            a NaN or an infinite value, are NaN, as with `pd.Series.rolling(window).mean()`.
+    """
+    if window < 1:
+        raise ValueError(f"window must be at least 1, got {window}")
+    return _rolling_mean(np.ascontiguousarray(a, dtype=np.float64), int(window))
+
+
+def zscore(a):
+    """
+    Standardizes a 1-D array to zero mean and unit (population) standard deviation.
+
+    The mean and standard deviation are computed over the non-NaN values; NaN inputs stay NaN.
+
+    Args:
+        a (array-like): The input data.
+
+    Returns:
+        np.ndarray: The z-scores as float64.
+    """
+    a = np.ascontiguousarray(a, dtype=np.float64)
+    if a.size == 0:
+        return a
+    return _zscore(a)
+
+
+def _check_group_args(codes, values, n_groups):
+    # The compiled reduction does not bounds-check, so out-of-range codes must be rejected up front
+    codes = np.ascontiguousarray(codes, dtype=np.int64)
+    values = np.ascontiguousarray(values, dtype=np.float64)
+    n_groups = int(n_groups)
+    if codes.shape != values.shape:
+        raise ValueError(f"codes and values must have the same shape, got {codes.shape} and {values.shape}")
+    if codes.size and codes.max() >= n_groups:
+        raise ValueError(f"group code {codes.max()} is out of range for {n_groups} groups")
+    return codes, values, n_groups
+
+
+def group_min(codes, values, n_groups):
+    """
+    Computes the minimum of `values` within each group.
+
+    Args:
+        codes (array-like): The integer group code of each value, in [0, n_groups). Negative codes are ignored,
+            matching the codes returned by `pd.factorize` for missing keys.
+        values (array-like): The values to reduce.
+        n_groups (int): The number of groups.
+
+    Returns:
+        np.ndarray: The minimum of each group, or NaN for groups without values.
+
+    Raises:
+        ValueError: If a code is not below `n_groups`, or `codes` and `values` differ in length.
+    """
+    return _group_reduce(*_check_group_args(codes, values, n_groups), False)
+
+
+def group_max(codes, values, n_groups):
+    """
+    Computes the maximum of `values` within each group.
+
+    Args:
+        codes (array-like): The integer group code of each value, in [0, n_groups). Negative codes are ignored,
+            matching the codes returned by `pd.factorize` for missing keys.
+        values (array-like): The values to reduce.
+        n_groups (int): The number of groups.
+
+    Returns:
+        np.ndarray: The maximum of each group, or NaN for groups without values.
+
+    Raises:
+        ValueError: If a code is not below `n_groups`, or `codes` and `values` differ in length.
+    """
+    return _group_reduce(*_check_group_args(codes, values, n_groups), True)
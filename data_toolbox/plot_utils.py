@@ -1,10 +1,137 @@
 
 import plotly.graph_objects as go
+from plotly.subplots import make_subplots
 import matplotlib.pyplot as plt
+import numpy as np
 import pandas as pd
 
+try:
+    import numexpr as ne
+except ImportError:
+    ne = None
 
-def create_dual_y_axis_plot_matplotlib(x, y1, y2, y1_label='Y1 Axis', y2_label='Y2 Axis', x_label='X Axis', title='Dual Y Axis Plot'):
+
+# Above this many points Plotly traces are drawn with WebGL (Scattergl) instead of SVG
+WEBGL_MIN_POINTS = 5000
+# Number of points per series kept when dual Y-axis plots are downsampled, roughly the screen's pixel width
+LTTB_THRESHOLD = 2000
+# NumPy functions available to prepare_series expressions when numexpr is not installed
+_NUMPY_EXPR_FUNCTIONS = {
+    name: getattr(np, name)
+    for name in ('sin', 'cos', 'tan', 'arcsin', 'arccos', 'arctan', 'arctan2', 'sinh', 'cosh', 'tanh',
+                 'arcsinh', 'arccosh', 'arctanh', 'log', 'log10', 'log1p', 'exp', 'expm1', 'sqrt', 'abs',
+                 'where', 'real', 'imag', 'conj', 'floor', 'ceil')
+}
+
+
+def _lttb(x, y, threshold):
+    """
+    Selects the points of a series to keep with the Largest-Triangle-Three-Buckets algorithm.
+
+    The series is split into `threshold - 2` buckets and from each bucket the point forming the largest
+    triangle with the previously kept point and the average of the next bucket is kept, which preserves
+    the visual shape of the line. The first and last points are always kept.
+
+    Args:
+        x (np.ndarray): The numeric X data, sorted in plotting order.
+        y (np.ndarray): The Y data.
+        threshold (int): The number of points to keep.
+
+    Returns:
+        np.ndarray: The indices of the kept points, in increasing order.
+    """
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    # Bucket i covers [edges[i], edges[i + 1]); the first and last points sit outside the buckets
+    edges = np.arange(threshold - 1, dtype=np.int64) * (n - 2) // (threshold - 2) + 1
+
+    indices = np.empty(threshold, dtype=np.int64)
+    indices[0], indices[-1] = 0, n - 1
+    a = 0
+
+    for i in range(threshold - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < len(edges) else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        areas = np.abs((x[a] - avg_x) * (y[start:end] - y[a]) - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(np.nan_to_num(areas, nan=-1.0)))
+        indices[i + 1] = a
+
+    return indices
+
+
+def _dual_y_prelude(x, y1, y2, downsample=False, threshold=None):
+    """
+    Prepares the data shared by the dual Y-axis plot functions.
+
+    The data is converted to NumPy arrays once, so the plotting backends can use it directly
+    (no copy is made if the inputs are already arrays of the right dtype).
+
+    Args:
+        x (list or array-like): The data for the X axis.
+        y1 (list or array-like): The data for the first Y axis.
+        y2 (list or array-like): The data for the second Y axis.
+        downsample (bool or None): Whether to reduce the series with LTTB. If None, they are downsampled when
+            they have more than 10 times `threshold` points. Default is False.
+        threshold (int, optional): The number of points kept per series when downsampling. Default is
+            LTTB_THRESHOLD.
+
+    Returns:
+        Tuple[np.ndarray, np.ndarray, np.ndarray]: The X data and the two Y series as float64 arrays.
+    """
+    x, y1, y2 = np.asarray(x), np.asarray(y1, dtype=np.float64), np.asarray(y2, dtype=np.float64)
+
+    if threshold is None:
+        threshold = LTTB_THRESHOLD
+    if downsample is None:
+        downsample = len(x) > 10 * threshold
+    if not downsample or len(x) <= threshold:
+        return x, y1, y2
+
+    # LTTB needs numeric X positions; categorical X is treated as evenly spaced
+    if np.issubdtype(x.dtype, np.number):
+        x_num = x.astype(np.float64)
+    elif np.issubdtype(x.dtype, np.datetime64):
+        x_num = x.astype('datetime64[ns]').astype(np.int64).astype(np.float64)
+    else:
+        x_num = np.arange(len(x), dtype=np.float64)
+
+    # Keep the points selected for either series so both share the same X values
+    indices = np.union1d(_lttb(x_num, y1, threshold), _lttb(x_num, y2, threshold))
+    return x[indices], y1[indices], y2[indices]
+
+
+def prepare_series(expr, **arrays):
+    """
+    Evaluates an element-wise array expression, e.g. to derive a series for the dual Y-axis plots.
+
+    If numexpr is installed the expression is compiled and evaluated in multi-threaded, cache-blocked
+    chunks, which avoids the temporary arrays NumPy creates for every intermediate operation. Otherwise it
+    is evaluated with NumPy.
+
+    Example:
+        y = prepare_series('(a - b) / (c + 1e-9)', a=a, b=b, c=c)
+
+    Args:
+        expr (str): The expression to evaluate, using the keyword argument names as variables.
+        **arrays (array-like): The arrays referenced by the expression.
+
+    Returns:
+        np.ndarray: The result of the expression.
+    """
+    if ne is not None:
+        return ne.evaluate(expr, local_dict=arrays)
+
+    local_dict = {name: np.asarray(value) for name, value in arrays.items()}
+    return np.asarray(eval(expr, {'__builtins__': {}, **_NUMPY_EXPR_FUNCTIONS}, local_dict))
+
+
+def create_dual_y_axis_plot_matplotlib(x, y1, y2, y1_label='Y1 Axis', y2_label='Y2 Axis', x_label='X Axis', title='Dual Y Axis Plot',
+                                       downsample=None, threshold=LTTB_THRESHOLD):
     """
     Creates a dual Y-axis plot using Matplotlib.
 
@@ -16,11 +143,15 @@ def create_dual_y_axis_plot_matplotlib(x, y1, y2, y1_label='Y1 Axis', y2_label='
         y2_label (str): The label for the second Y axis. Default is 'Y2 Axis'.
         x_label (str): The label for the X axis. Default is 'X Axis'.
         title (str): The title of the plot. Default is 'Dual Y Axis Plot'.
+        downsample (bool or None): Whether to downsample the series with Largest-Triangle-Three-Buckets before
+            plotting. If None, long series (more than 10 times `threshold` points) are downsampled. Default is None.
+        threshold (int): The number of points kept per series when downsampling. Default is LTTB_THRESHOLD.
 
     Returns:
         fig, ax1, ax2: Matplotlib figure and axes objects for further customization.
     """
-    
+    x, y1, y2 = _dual_y_prelude(x, y1, y2, downsample=downsample, threshold=threshold)
+
     # Determine the size of the figure based on the length of the data
     fig_width = max(10, len(x) / 10)  # Ensure a minimum width of 10
     fig_height = 6  # Fixed height for better aspect ratio
@@ -58,10 +189,43 @@ def create_dual_y_axis_plot_matplotlib(x, y1, y2, y1_label='Y1 Axis', y2_label='
     return fig, ax1, ax2
 
 
-def create_dual_y_axis_plot_plotly(x, y1, y2, y1_label='Y1 Axis', y2_label='Y2 Axis', x_label='X Axis', title='Dual Y Axis Plot'):
+def update_dual_y_axis_plot_matplotlib(ax1, ax2, x, y1, y2, downsample=None, threshold=LTTB_THRESHOLD) -> None:
+    """
+    Replaces the data of a plot created by `create_dual_y_axis_plot_matplotlib` without re-creating it.
+
+    The existing lines are reused through `set_data`, which is much cheaper than drawing a new plot.
+
+    Args:
+        ax1 (matplotlib.axes.Axes): The axes of the first Y axis.
+        ax2 (matplotlib.axes.Axes): The axes of the second Y axis.
+        x (list or array-like): The new data for the X axis.
+        y1 (list or array-like): The new data for the first Y axis.
+        y2 (list or array-like): The new data for the second Y axis.
+        downsample (bool or None): Whether to downsample the series with Largest-Triangle-Three-Buckets before
+            plotting. If None, long series (more than 10 times `threshold` points) are downsampled. Default is None.
+        threshold (int): The number of points kept per series when downsampling. Default is LTTB_THRESHOLD.
+
+    Returns:
+        None
+    """
+    x, y1, y2 = _dual_y_prelude(x, y1, y2, downsample=downsample, threshold=threshold)
+
+    for ax, y in ((ax1, y1), (ax2, y2)):
+        ax.lines[0].set_data(x, y)
+        ax.relim()
+        ax.autoscale_view()
+
+    ax1.figure.canvas.draw_idle()
+
+
+def create_dual_y_axis_plot_plotly(x, y1, y2, y1_label='Y1 Axis', y2_label='Y2 Axis', x_label='X Axis', title='Dual Y Axis Plot',
+                                   downsample=None, threshold=LTTB_THRESHOLD):
     """
     Creates a dual Y-axis plot using Plotly.
 
+    Series longer than WEBGL_MIN_POINTS (before any downsampling) are drawn as WebGL `Scattergl` traces with lines only,
+    which keeps rendering and interaction fast for large data.
+
     Args:
         x (list or array-like): The data for the X axis.
         y1 (list or array-like): The data for the first Y axis.
@@ -70,51 +234,98 @@ def create_dual_y_axis_plot_plotly(x, y1, y2, y1_label='Y1 Axis', y2_label='Y2 A
         y2_label (str): The label for the second Y axis. Default is 'Y2 Axis'.
         x_label (str): The label for the X axis. Default is 'X Axis'.
         title (str): The title of the plot. Default is 'Dual Y Axis Plot'.
+        downsample (bool or None): Whether to downsample the series with Largest-Triangle-Three-Buckets before
+            plotting. If None, long series (more than 10 times `threshold` points) are downsampled. Default is None.
+        threshold (int): The number of points kept per series when downsampling. Default is LTTB_THRESHOLD.
 
     Returns:
         fig (go.Figure): A Plotly Figure object representing the dual Y-axis plot.
     """
-    
-    fig = go.Figure()
+    # Large series are rendered with WebGL and without per-point markers, judged before downsampling
+    # since LTTB never returns more than WEBGL_MIN_POINTS points with the default threshold
+    large = len(x) > WEBGL_MIN_POINTS
+    x, y1, y2 = _dual_y_prelude(x, y1, y2, downsample=downsample, threshold=threshold)
+
+    if large:
+        trace_type, mode = go.Scattergl, 'lines'
+    else:
+        trace_type, mode = go.Scatter, 'lines+markers'
+
+    fig = make_subplots(specs=[[{'secondary_y': True}]])
 
-    fig.add_trace(go.Scatter(
+    fig.add_trace(trace_type(
         x=x, 
         y=y1, 
-        mode='lines+markers',
-        name=y1_label,
-        yaxis='y1'
-    ))
+        mode=mode,
+        name=y1_label
+    ), secondary_y=False)
 
-    fig.add_trace(go.Scatter(
+    fig.add_trace(trace_type(
         x=x, 
         y=y2, 
-        mode='lines+markers',
-        name=y2_label,
-        yaxis='y2'
-    ))
-
-    fig.update_layout(
-        title=title,
-        xaxis=dict(title=x_label),
-        yaxis=dict(
-            title=y1_label,
-            titlefont=dict(color='blue'),
-            tickfont=dict(color='blue')
-        ),
-        yaxis2=dict(
-            title=y2_label,
-            titlefont=dict(color='red'),
-            tickfont=dict(color='red'),
-            overlaying='y',
-            side='right'
-        ),
-        legend=dict(x=0.1, y=1.1)
-    )
+        mode=mode,
+        name=y2_label
+    ), secondary_y=True)
+
+    fig.update_xaxes(title_text=x_label)
+    fig.update_yaxes(title_text=y1_label, title_font=dict(color='blue'), tickfont=dict(color='blue'),
+                     secondary_y=False)
+    fig.update_yaxes(title_text=y2_label, title_font=dict(color='red'), tickfont=dict(color='red'),
+                     secondary_y=True)
+    fig.update_layout(title=title, legend=dict(x=0.1, y=1.1))
 
     return fig
 
 
-def boxplot_by_column(data: pd.DataFrame, group_col: str, check_col: str):
+def _grouped_box_stats(data: pd.DataFrame, group_col: str, check_col: str, showfliers: bool = False):
+    """
+    Computes the boxplot statistics of a column for each group, in the format expected by `Axes.bxp`.
+
+    All statistics are computed with pandas' vectorized group reductions.
+
+    Args:
+        data (pd.DataFrame): The input data frame containing the data.
+        group_col (str): The column name to group by.
+        check_col (str): The column name for which the statistics are computed.
+        showfliers (bool): If True, whiskers follow the 1.5 * IQR rule and the points beyond them are returned
+            as fliers. If False, whiskers span the minimum and maximum and no fliers are computed. Default is False.
+
+    Returns:
+        List[dict]: One dictionary of statistics per group, ordered by group key.
+    """
+    quantiles = data.groupby(group_col)[check_col].quantile([0, .25, .5, .75, 1]).unstack().dropna()
+    whislo, whishi = quantiles[0], quantiles[1]
+    fliers = {}
+
+    if showfliers:
+        q1 = data[group_col].map(quantiles[.25])
+        q3 = data[group_col].map(quantiles[.75])
+        iqr = q3 - q1
+        values = data[check_col]
+        inlier = values.between(q1 - 1.5 * iqr, q3 + 1.5 * iqr)
+
+        inlier_values = values[inlier].groupby(data.loc[inlier, group_col])
+        whislo, whishi = inlier_values.min(), inlier_values.max()
+
+        outlier = ~inlier & values.notna() & q1.notna()
+        fliers = {key: group.to_numpy() for key, group in values[outlier].groupby(data.loc[outlier, group_col])}
+
+    return [
+        {
+            'label': str(key),
+            'whislo': whislo[key],
+            'q1': row[.25],
+            'med': row[.5],
+            'q3': row[.75],
+            'whishi': whishi[key],
+            'fliers': fliers.get(key, []),
+        }
+        for key, row in quantiles.iterrows()
+    ]
+
+
+def boxplot_by_column(data: pd.DataFrame, group_col: str, check_col: str, showfliers: bool = False,
+                      stat: str = None, window: int = None):
     """
     Draws a boxplot for the specified column, grouped by another column.
 
@@ -122,37 +333,62 @@ def boxplot_by_column(data: pd.DataFrame, group_col: str, check_col: str):
         data (pd.DataFrame): The input data frame containing the data.
         group_col (str): The column name to group by (e.g., date).
         check_col (str): The column name for which the boxplot is to be drawn.
+        showfliers (bool): Whether to draw outliers beyond 1.5 * IQR. If False, whiskers span the full range of
+            each group and outliers are not computed. Default is False.
+        stat (str, optional): A transformation applied to `check_col` (in row order) before grouping:
+            'rolling_mean' or 'zscore'. The JIT-compiled helpers from `numeric_utils` are used. Default is None.
+        window (int, optional): The window size, required when `stat` is 'rolling_mean'.
+
+    Raises:
+        ValueError: If `stat` is unsupported, `window` is missing, or no group has any non-missing value.
 
     Notes:
+        - The box statistics are precomputed with pandas group reductions and drawn with `Axes.bxp`.
         - The figure width is automatically adjusted based on the length of x-axis labels to ensure they fit within the 
           plot. The width adjustment factor is determined by the length of the longest label.
         - If any x-axis label exceeds a certain length (default is 10 characters), the labels are rotated 90 degrees
           to improve readability.
     """
+    if stat is not None:
+        # Imported lazily so that plotting without a transform does not pay for importing Numba
+        from .numeric_utils import rolling_mean, zscore
+
+    if stat == 'rolling_mean':
+        if window is None:
+            raise ValueError("window is required when stat is 'rolling_mean'")
+        data = data.assign(**{check_col: rolling_mean(data[check_col].to_numpy(), window)})
+    elif stat == 'zscore':
+        data = data.assign(**{check_col: zscore(data[check_col].to_numpy())})
+    elif stat is not None:
+        raise ValueError(f"Unsupported stat: {stat!r}, expected 'rolling_mean' or 'zscore'")
+
     # Create subplots
     fig, ax1 = plt.subplots(figsize=(10, 6))
 
     # Draw the boxplot
-    data.boxplot(column=check_col, by=group_col, ax=ax1)
+    stats = _grouped_box_stats(data, group_col, check_col, showfliers=showfliers)
+    if not stats:
+        plt.close(fig)
+        raise ValueError(f"No group of {group_col!r} has non-missing values in {check_col!r} to plot")
+    ax1.bxp(stats, showfliers=showfliers)
+    ax1.grid(True)
     ax1.set_xlabel(group_col.capitalize())
     ax1.set_ylabel(check_col.capitalize())
     ax1.set_title(f'Boxplot of {check_col.capitalize()} by {group_col.capitalize()}')
 
-    # Get current x-tick labels
-    labels = [item.get_text() for item in ax1.get_xticklabels()]
+    # Get x-tick labels
+    labels = [box['label'] for box in stats]
 
-    # Calculate maximum label length
-    max_label_length = max(len(label) for label in labels)
+    # Calculate maximum label length once, for both the figure size and the rotation
+    labels_arr = np.asarray(labels, dtype=str)
+    max_label_length = int(np.char.str_len(labels_arr).max()) if labels_arr.size else 0
 
     # Adjust figure size based on the maximum label length
     fig_width = 10 + max_label_length * 0.2 
     fig.set_size_inches(fig_width, 6)
 
     # Rotate x-axis labels if any label is particularly long
-    max_label_length = max(len(label) for label in labels)
     if max_label_length > 10:  
         plt.xticks(rotation=90)
         
-    # Remove the default 'Boxplot' title
-    plt.suptitle('')
-    plt.show()
\ No newline at end of file
+    plt.show()
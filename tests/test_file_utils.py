@@ -0,0 +1,231 @@
+import multiprocessing
+import os
+
+import pytest
+
+from data_toolbox import file_utils
+
+
+def test_get_all_suffix_files_matches_os_walk(tmp_path):
+    (tmp_path / 'sub' / 'deeper').mkdir(parents=True)
+    for name in ('a.csv', 'b.txt', 'sub/c.csv', 'sub/deeper/d.csv', 'sub/deeper/e.pdf'):
+        (tmp_path / name).touch()
+    # A symlink to a directory whose name has the suffix must be neither returned nor descended into
+    os.symlink(tmp_path / 'sub', tmp_path / 'link.csv')
+
+    expected = sorted(
+        os.path.join(root, file)
+        for root, _, files in os.walk(tmp_path)
+        for file in files
+        if file.endswith('.csv')
+    )
+
+    assert sorted(file_utils.get_all_suffix_files(str(tmp_path))) == expected
+    assert sorted(file_utils.iter_suffix_files(str(tmp_path), ('.csv', '.pdf'))) == sorted(
+        expected + [str(tmp_path / 'sub' / 'deeper' / 'e.pdf')]
+    )
+
+
+def test_extract_text_from_pptx_matches_python_pptx(tmp_path):
+    pptx = pytest.importorskip('pptx')
+    from pptx.util import Inches
+
+    presentation = pptx.Presentation()
+    # More than ten slides, so slide order cannot come from sorting part names
+    for i in range(12):
+        slide = presentation.slides.add_slide(presentation.slide_layouts[1])
+        slide.shapes.title.text = f'Title {i}'
+        text_frame = slide.placeholders[1].text_frame
+        text_frame.text = f'First paragraph {i}'
+        text_frame.add_paragraph().text = 'Line\vbreak'
+        slide.shapes.add_textbox(Inches(1), Inches(1), Inches(2), Inches(1)).text_frame.text = f'Box {i}'
+        slide.shapes.add_table(2, 2, Inches(1), Inches(3), Inches(4), Inches(1)).table.cell(0, 0).text = 'cell'
+    file_path = str(tmp_path / 'deck.pptx')
+    presentation.save(file_path)
+
+    expected = [
+        shape.text
+        for slide in pptx.Presentation(file_path).slides
+        for shape in slide.shapes
+        if shape.has_text_frame
+    ]
+
+    assert file_utils.extract_text_from_pptx_as_list(file_path) == expected
+
+
+def test_read_word_document_matches_python_docx(tmp_path):
+    docx = pytest.importorskip('docx')
+    from docx.oxml import OxmlElement
+
+    document = docx.Document()
+    for i in range(30):
+        paragraph = document.add_paragraph(f'Paragraph {i}\twith a tab')
+        run = paragraph.add_run(' and a break')
+        run.add_break()
+        paragraph.add_run('after')
+        special = paragraph.add_run('pre')
+        special._r.append(OxmlElement('w:noBreakHyphen'))
+        special._r.append(OxmlElement('w:ptab'))
+        special._r.append(OxmlElement('w:t'))
+        special._r[-1].text = 'post'
+        if i % 10 == 0:
+            document.add_table(rows=2, cols=2).cell(0, 0).text = 'nested cell'
+    document.add_page_break()
+    document.add_paragraph('')
+    file_path = str(tmp_path / 'document.docx')
+    document.save(file_path)
+
+    expected = [paragraph.text for paragraph in docx.Document(file_path).paragraphs]
+    assert expected[0].endswith('pre-\tpost')
+
+    assert file_utils.read_word_document(file_path) == expected
+    assert file_utils.read_word_document(file_path, fast=False) == expected
+
+
+def test_cached_file_reader_invalidates_on_mtime_change(tmp_path):
+    calls = []
+
+    @file_utils.cached_file_reader
+    def reader(file_path):
+        calls.append(file_path)
+        with open(file_path) as f:
+            return [f.read()]
+
+    file_path = tmp_path / 'data.txt'
+    file_path.write_text('first')
+
+    assert reader(str(file_path)) == ['first']
+    assert reader(str(file_path)) == ['first']
+    assert len(calls) == 1
+
+    # Same size, new modification time
+    file_path.write_text('other')
+    stat = os.stat(file_path)
+    os.utime(file_path, ns=(stat.st_atime_ns, stat.st_mtime_ns + 1_000_000_000))
+
+    assert reader(str(file_path)) == ['other']
+    assert len(calls) == 2
+
+
+def test_cached_file_reader_returns_copies(tmp_path):
+    @file_utils.cached_file_reader
+    def reader(file_path):
+        return ['text']
+
+    file_path = tmp_path / 'data.txt'
+    file_path.write_text('x')
+
+    reader(str(file_path)).append('mutated')
+
+    assert reader(str(file_path)) == ['text']
+
+
+def _make_pdf(file_path, num_pages, filler_lines=0):
+    fitz = pytest.importorskip('fitz')
+
+    doc = fitz.open()
+    for i in range(num_pages):
+        page = doc.new_page()
+        page.insert_text((72, 72), f'Page {i}')
+        for j in range(filler_lines):
+            page.insert_text((72, 90 + j * 14), f'filler line {i} {j} ' * 3)
+    doc.save(file_path, deflate=False)
+    doc.close()
+
+    with fitz.open(file_path) as doc:
+        return [page.get_text('text') for page in doc]
+
+
+def _read_pdf_length_in_worker(file_path):
+    return len(file_utils.read_pdf_document(file_path, parallel=True))
+
+
+def test_read_pdf_document_small_and_large(tmp_path):
+    small_path = str(tmp_path / 'small.pdf')
+    large_path = str(tmp_path / 'large.pdf')
+    small_expected = _make_pdf(small_path, 3)
+    large_expected = _make_pdf(large_path, 12, filler_lines=40)
+    # The large document goes through the memory-mapped path
+    assert os.path.getsize(large_path) >= file_utils.PDF_MMAP_MIN_SIZE
+
+    assert file_utils.read_pdf_document(small_path) == small_expected
+    assert file_utils.read_pdf_document(large_path) == large_expected
+    assert list(file_utils.iter_pdf_pages(large_path)) == large_expected
+
+
+def test_read_pdf_document_parallel_matches_serial(tmp_path):
+    file_path = str(tmp_path / 'long.pdf')
+    expected = _make_pdf(file_path, file_utils.PARALLEL_PDF_MIN_PAGES + 5)
+
+    assert file_utils.read_pdf_document(file_path, parallel=True) == expected
+
+
+def test_read_pdf_document_parallel_from_daemonic_worker(tmp_path):
+    file_path = str(tmp_path / 'long.pdf')
+    expected = _make_pdf(file_path, file_utils.PARALLEL_PDF_MIN_PAGES + 5)
+
+    # Daemonic pool workers may not start children, so the reader must fall back to serial extraction
+    with multiprocessing.get_context('fork').Pool(1) as pool:
+        assert pool.map(_read_pdf_length_in_worker, [file_path]) == [len(expected)]
+
+
+def test_read_pdf_document_returns_none_on_errors(tmp_path):
+    pytest.importorskip('fitz')
+    bad_path = tmp_path / 'bad.pdf'
+    bad_path.write_text('not a pdf')
+
+    assert file_utils.read_pdf_document(str(tmp_path / 'missing.pdf')) is None
+    assert file_utils.read_pdf_document(str(bad_path)) is None
+
+
+def test_read_pdfs_batch(tmp_path):
+    first_path = str(tmp_path / 'first.pdf')
+    second_path = str(tmp_path / 'second.pdf')
+    missing_path = str(tmp_path / 'missing.pdf')
+    first_expected = _make_pdf(first_path, 2)
+    second_expected = _make_pdf(second_path, 4)
+
+    assert file_utils.read_pdfs_batch([first_path, missing_path, second_path], workers=2) == {
+        first_path: first_expected,
+        missing_path: None,
+        second_path: second_expected,
+    }
+
+
+def _read_many_fixture(tmp_path):
+    docx = pytest.importorskip('docx')
+
+    text_path = tmp_path / 'notes.txt'
+    text_path.write_text('plain text')
+    document = docx.Document()
+    document.add_paragraph('In a document')
+    document_path = tmp_path / 'document.docx'
+    document.save(str(document_path))
+
+    return [str(text_path), str(tmp_path / 'missing.txt'), str(document_path)]
+
+
+def test_read_many(tmp_path):
+    paths = _read_many_fixture(tmp_path)
+
+    assert file_utils.read_many(paths) == {
+        paths[0]: 'plain text',
+        paths[1]: None,
+        paths[2]: ['In a document'],
+    }
+
+
+def test_read_many_with_failing_fast_reading_backend(tmp_path, monkeypatch):
+    paths = _read_many_fixture(tmp_path)
+
+    def flatten_files_batch_iterator(batch, batch_size):
+        for path in batch:
+            with open(path, 'rb') as f:
+                yield bytearray(f.read())
+
+    monkeypatch.setattr(file_utils, 'FlattenFilesBatchIterator', flatten_files_batch_iterator)
+
+    # The backend raises on the missing file; the batch must still be read with a None for that file
+    assert list(file_utils.iter_file_bytes(paths[:2])) == [b'plain text', None]
+    assert list(file_utils.iter_file_bytes(paths[:1])) == [b'plain text']
+    assert file_utils.read_many(paths)[paths[1]] is None
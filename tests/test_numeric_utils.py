@@ -0,0 +1,80 @@
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_toolbox import numeric_utils
+
+
+ROLLING_MEAN_IMPLEMENTATIONS = [numeric_utils.rolling_mean,
+                                lambda a, window: numeric_utils._rolling_mean_numpy(np.asarray(a, dtype=np.float64),
+                                                                                    window)]
+
+
+@pytest.mark.parametrize('rolling_mean', ROLLING_MEAN_IMPLEMENTATIONS)
+@pytest.mark.parametrize('values', [
+    [np.inf, 1, 2, 3, 4],
+    [1, np.inf, 2, 3],
+    [1, -np.inf, 2, 3, 4],
+    [1e16, 1, 2, 3, 4, 5],
+    [1, 2, np.nan, 4, 5, 6, 7],
+    [1, 2],
+])
+@pytest.mark.parametrize('window', [1, 2, 3])
+def test_rolling_mean_matches_pandas_on_edge_values(rolling_mean, values, window):
+    expected = pd.Series(values, dtype=np.float64).rolling(window).mean().to_numpy()
+
+    np.testing.assert_allclose(rolling_mean(values, window), expected, rtol=1e-12)
+
+
+@pytest.mark.parametrize('rolling_mean', ROLLING_MEAN_IMPLEMENTATIONS)
+@pytest.mark.parametrize('n, window', [(1000, 7), (1000, 10), (1001, 1000), (50, 100)])
+def test_rolling_mean_matches_pandas_on_large_offsets(rolling_mean, n, window):
+    # A large offset with a small signal exposes cancellation in cumulative-sum approaches
+    values = 1e9 + np.random.default_rng(n).random(n)
+    expected = pd.Series(values).rolling(window).mean().to_numpy()
+
+    np.testing.assert_allclose(rolling_mean(values, window), expected, rtol=0, atol=1e-5)
+
+
+def test_rolling_mean_rejects_empty_window():
+    with pytest.raises(ValueError):
+        numeric_utils.rolling_mean([1.0, 2.0], 0)
+
+
+@pytest.mark.parametrize('zscore', [numeric_utils.zscore, numeric_utils._zscore_numpy])
+def test_zscore_ignores_missing_values(zscore):
+    values = np.random.default_rng(0).standard_normal(200)
+    values[[3, 50]] = np.nan
+
+    expected = (values - np.nanmean(values)) / np.nanstd(values)
+
+    np.testing.assert_allclose(zscore(values), expected)
+
+
+@pytest.mark.parametrize('use_numpy', [False, True])
+def test_group_min_max_match_pandas(use_numpy):
+    rng = np.random.default_rng(0)
+    keys = pd.Series(rng.choice(['a', 'b', 'c', None], size=500))
+    values = rng.standard_normal(500)
+    values[::37] = np.nan
+    codes, uniques = pd.factorize(keys)
+
+    grouped = pd.Series(values).groupby(keys)
+    expected_min = grouped.min().reindex(uniques).to_numpy()
+    expected_max = grouped.max().reindex(uniques).to_numpy()
+
+    if use_numpy:
+        result_min = numeric_utils._group_reduce_numpy(codes, values, len(uniques), False)
+        result_max = numeric_utils._group_reduce_numpy(codes, values, len(uniques), True)
+    else:
+        result_min = numeric_utils.group_min(codes, values, len(uniques))
+        result_max = numeric_utils.group_max(codes, values, len(uniques))
+
+    np.testing.assert_allclose(result_min, expected_min)
+    np.testing.assert_allclose(result_max, expected_max)
+
+
+@pytest.mark.parametrize('reduce', [numeric_utils.group_min, numeric_utils.group_max])
+def test_group_reduce_rejects_out_of_range_codes(reduce):
+    with pytest.raises(ValueError):
+        reduce([0, 5], [1.0, 2.0], 2)
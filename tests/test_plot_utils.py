@@ -0,0 +1,151 @@
+import matplotlib
+
+matplotlib.use('Agg')
+
+import matplotlib.cbook as cbook
+import matplotlib.pyplot as plt
+import numpy as np
+import pandas as pd
+import pytest
+
+from data_toolbox import plot_utils
+
+
+def _reference_lttb(x, y, threshold):
+    # Straightforward per-point LTTB with exact integer bucket edges
+    n = len(x)
+    if threshold >= n or threshold < 3:
+        return np.arange(n)
+
+    indices = [0]
+    a = 0
+    for i in range(threshold - 2):
+        start = i * (n - 2) // (threshold - 2) + 1
+        end = (i + 1) * (n - 2) // (threshold - 2) + 1
+        next_end = min((i + 2) * (n - 2) // (threshold - 2) + 1, n)
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+
+        best_area, best_index = -1.0, start
+        for j in range(start, end):
+            area = abs((x[a] - avg_x) * (y[j] - y[a]) - (x[a] - x[j]) * (avg_y - y[a]))
+            if area > best_area:
+                best_area, best_index = area, j
+        a = best_index
+        indices.append(a)
+
+    indices.append(n - 1)
+    return np.array(indices)
+
+
+@pytest.fixture(autouse=True)
+def close_figures():
+    yield
+    plt.close('all')
+
+
+@pytest.mark.parametrize('n, threshold', [(1000, 50), (12345, 300), (101, 100), (4, 3), (50, 100)])
+def test_lttb_matches_reference(n, threshold):
+    rng = np.random.default_rng(n)
+    x = np.sort(rng.random(n))
+    y = rng.standard_normal(n).cumsum()
+
+    np.testing.assert_array_equal(plot_utils._lttb(x, y, threshold), _reference_lttb(x, y, threshold))
+
+
+def test_dual_y_prelude_downsamples_long_series_only():
+    x = np.arange(100_000)
+    y1, y2 = np.sin(x / 1000), np.cos(x / 700)
+
+    xs, ys1, ys2 = plot_utils._dual_y_prelude(x, y1, y2, downsample=None, threshold=500)
+    assert len(xs) == len(ys1) == len(ys2) <= 1000
+    assert xs[0] == 0 and xs[-1] == x[-1]
+
+    xs, _, _ = plot_utils._dual_y_prelude(x[:4000], y1[:4000], y2[:4000], downsample=None, threshold=500)
+    assert len(xs) == 4000
+
+
+def test_grouped_box_stats_match_matplotlib():
+    rng = np.random.default_rng(0)
+    data = pd.DataFrame({
+        'group': rng.choice(['a', 'b', 'c'], size=300),
+        'value': np.r_[rng.standard_normal(297), 15.0, -12.0, np.nan],
+    })
+
+    stats = plot_utils._grouped_box_stats(data, 'group', 'value', showfliers=True)
+
+    assert [box['label'] for box in stats] == ['a', 'b', 'c']
+    for box in stats:
+        values = data.loc[data['group'] == box['label'], 'value'].dropna().to_numpy()
+        expected = cbook.boxplot_stats(values)[0]
+        for key in ('whislo', 'q1', 'med', 'q3', 'whishi'):
+            assert box[key] == pytest.approx(expected[key])
+        np.testing.assert_allclose(np.sort(box['fliers']), np.sort(expected['fliers']))
+
+
+def test_boxplot_by_column_zscore_with_missing_values():
+    rng = np.random.default_rng(1)
+    data = pd.DataFrame({'group': np.arange(200) % 4, 'value': rng.random(200)})
+    data.loc[5, 'value'] = np.nan
+
+    plot_utils.boxplot_by_column(data, 'group', 'value', stat='zscore')
+
+
+def test_boxplot_by_column_without_values_raises():
+    data = pd.DataFrame({'group': [1, 2], 'value': [np.nan, np.nan]})
+
+    with pytest.raises(ValueError):
+        plot_utils.boxplot_by_column(data, 'group', 'value')
+
+
+def test_dual_y_axis_plot_plotly_small_series():
+    fig = plot_utils.create_dual_y_axis_plot_plotly([1, 2, 3], [1, 2, 3], [3, 2, 1], y1_label='Left',
+                                                    y2_label='Right', x_label='Time', title='Title')
+
+    assert [type(trace).__name__ for trace in fig.data] == ['Scatter', 'Scatter']
+    assert [trace.mode for trace in fig.data] == ['lines+markers', 'lines+markers']
+    assert [trace.name for trace in fig.data] == ['Left', 'Right']
+    assert fig.data[0].yaxis == 'y' and fig.data[1].yaxis == 'y2'
+    assert fig.layout.yaxis2.overlaying == 'y' and fig.layout.yaxis2.side == 'right'
+    assert fig.layout.yaxis.title.text == 'Left' and fig.layout.yaxis2.title.text == 'Right'
+    assert fig.layout.xaxis.title.text == 'Time' and fig.layout.title.text == 'Title'
+    np.testing.assert_array_equal(fig.data[1].y, [3, 2, 1])
+
+
+def test_dual_y_axis_plot_plotly_large_series_uses_webgl():
+    x = np.arange(50_000)
+    fig = plot_utils.create_dual_y_axis_plot_plotly(x, np.sin(x / 100), np.cos(x / 90))
+
+    assert [type(trace).__name__ for trace in fig.data] == ['Scattergl', 'Scattergl']
+    assert [trace.mode for trace in fig.data] == ['lines', 'lines']
+    # Downsampled, with both traces sharing the same X values
+    assert len(fig.data[0].x) < len(x)
+    np.testing.assert_array_equal(fig.data[0].x, fig.data[1].x)
+    assert fig.data[1].yaxis == 'y2'
+
+    fig = plot_utils.create_dual_y_axis_plot_plotly(x, np.sin(x / 100), np.cos(x / 90), downsample=False)
+    assert type(fig.data[0]).__name__ == 'Scattergl' and len(fig.data[0].x) == len(x)
+
+
+@pytest.mark.parametrize('use_numexpr', [True, False])
+def test_prepare_series(use_numexpr, monkeypatch):
+    if use_numexpr:
+        pytest.importorskip('numexpr')
+    else:
+        monkeypatch.setattr(plot_utils, 'ne', None)
+
+    a = np.arange(1.0, 6.0)
+    b = np.linspace(0.0, 1.0, 5)
+
+    np.testing.assert_allclose(plot_utils.prepare_series('(a - b) / (c + 1e-9)', a=a, b=b, c=a),
+                               (a - b) / (a + 1e-9))
+    np.testing.assert_allclose(plot_utils.prepare_series('sqrt(a) + where(b > 0.5, a, 0)', a=a, b=b),
+                               np.sqrt(a) + np.where(b > 0.5, a, 0))
+    np.testing.assert_allclose(plot_utils.prepare_series('a * 2', a=list(a)), a * 2)
+
+
+def test_prepare_series_fallback_has_no_builtins(monkeypatch):
+    monkeypatch.setattr(plot_utils, 'ne', None)
+
+    with pytest.raises(NameError):
+        plot_utils.prepare_series('open(a)', a=np.arange(3))